@@ -28,23 +28,23 @@ Usage:
 
 import pandas as pd
 import numpy as np
-from faker import Faker
-import random
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
 import os
 
 # ── Configuration ────────────────────────────────────────────
 SEED = 42
-random.seed(SEED)
-np.random.seed(SEED)
-fake = Faker('en_GB')
-Faker.seed(SEED)
+RNG  = np.random.default_rng(SEED)    # shared PCG64 generator — workers get spawned children
 
 NUM_CUSTOMERS  = 500
 NUM_MOMO_LEGIT = 7000    # was 8000
 NUM_BANK_LEGIT = 3500    # was 4000
 NUM_ATTACKS    = 200     # was 120
 OUTPUT_DIR     = "data/synthetic"
+PARALLEL_MIN_ROWS = 200_000    # below this, process start-up costs more than the generators themselves
+WRITE_BATCH_ROWS  = 50_000     # rows gathered into each DataFrame / Arrow table when writing CSVs
 
 # BoG regulatory reporting floor — used for structured drain detection only
 # NOT used as the primary fraud detection threshold
@@ -64,11 +64,92 @@ INCOME_TIERS = {
 
 INCOME_TIER_WEIGHTS = [0.55, 0.35, 0.10]    # 55% low-income — reflects Ghana's reality
 
+# Pre-built arrays for bulk sampling — converted once, not on every draw
+TIER_NAMES  = np.array(list(INCOME_TIERS))
+REGIONS_ARR = np.array(REGIONS)
+REGIONS_NOSPACE = np.array([r.replace(" ", "") for r in REGIONS])    # as used in agent IDs
+# Every possible agent ID, one row per region — agent IDs are sampled from this pool
+AGENT_POOL  = np.char.add(
+    np.char.add(np.char.add("AGT-", REGIONS_NOSPACE), "-")[:, None],
+    np.char.zfill(np.arange(1, 100).astype(str), 4),
+)
+
 MERCHANT_CATEGORIES = ["food", "utility", "retail", "airtime", "transfer", "unknown"]
 MOMO_TX_TYPES       = ["send", "receive", "withdraw", "airtime", "bill_payment", "transfer"]
 BANK_TX_TYPES       = ["transfer", "withdrawal", "deposit", "momo_link"]
 MOMO_CHANNELS       = ["ussd", "app", "agent"]
 BANK_CHANNELS       = ["mobile", "internet", "atm", "branch", "momo"]
+ATTACK_TYPES        = ["none", "otp_phishing", "account_takeover", "structured_drain", "lateral_movement"]
+
+# Money columns — drawn amounts and opening balances are rounded to the pesewa when drawn,
+# so derived balances satisfy before - amount == after; rounded again at output to clear float noise
+MONEY_COLUMNS = {"amount_ghs", "balance_before_ghs", "balance_after_ghs", "personal_alert_threshold"}
+
+# Output dtypes — enum-like columns as categoricals, numerics as narrow as they fit.
+# Balances stay float64: float32 loses pesewa precision above ~131,072 GHS.
+MOMO_DTYPES = {
+    "amount_ghs":        np.float32,
+    "transaction_type":  pd.CategoricalDtype(MOMO_TX_TYPES),
+    "channel":           pd.CategoricalDtype(MOMO_CHANNELS),
+    "merchant_category": pd.CategoricalDtype(MERCHANT_CATEGORIES),
+    "location_region":   pd.CategoricalDtype(REGIONS),
+    "income_tier":       pd.CategoricalDtype(list(INCOME_TIERS)),
+    "label":             np.int8,
+    "attack_type":       pd.CategoricalDtype(ATTACK_TYPES),
+}
+BANK_DTYPES = {
+    "amount_ghs":         np.float32,
+    "transaction_type":   pd.CategoricalDtype(BANK_TX_TYPES),
+    "channel":            pd.CategoricalDtype(BANK_CHANNELS),
+    "location_region":    pd.CategoricalDtype(REGIONS),
+    "income_tier":        pd.CategoricalDtype(list(INCOME_TIERS)),
+    "label":              np.int8,
+    "attack_type":        pd.CategoricalDtype(ATTACK_TYPES),
+}
+
+# Arrow schemas for the batched CSV writers — fixed up front so every batch matches
+CATEGORY = pa.dictionary(pa.int8(), pa.string())
+MOMO_SCHEMA = pa.schema([
+    ("transaction_id",           pa.string()),
+    ("timestamp",                pa.timestamp("us")),
+    ("sender_account",           pa.string()),
+    ("receiver_account",         pa.string()),
+    ("amount_ghs",               pa.float32()),
+    ("transaction_type",         CATEGORY),
+    ("channel",                  CATEGORY),
+    ("agent_id",                 pa.string()),
+    ("merchant_category",        CATEGORY),
+    ("location_region",          CATEGORY),
+    ("device_id",                pa.string()),
+    ("is_new_device",            pa.bool_()),
+    ("otp_requested",            pa.bool_()),
+    ("linked_bank_account",      pa.string()),
+    ("income_tier",              CATEGORY),
+    ("personal_alert_threshold", pa.float64()),
+    ("label",                    pa.int8()),
+    ("attack_type",              CATEGORY),
+])
+BANK_SCHEMA = pa.schema([
+    ("transaction_id",           pa.string()),
+    ("timestamp",                pa.timestamp("us")),
+    ("account_id",               pa.string()),
+    ("linked_momo_account",      pa.string()),
+    ("amount_ghs",               pa.float32()),
+    ("transaction_type",         CATEGORY),
+    ("channel",                  CATEGORY),
+    ("counterparty_account",     pa.string()),
+    ("balance_before_ghs",       pa.float64()),
+    ("balance_after_ghs",        pa.float64()),
+    ("location_region",          CATEGORY),
+    ("is_after_hours",           pa.bool_()),
+    ("income_tier",              CATEGORY),
+    ("personal_alert_threshold", pa.float64()),
+    ("label",                    pa.int8()),
+    ("attack_type",              CATEGORY),
+])
+# What generators fill — everything after transaction_id, which is assigned at write time
+MOMO_COLUMNS = tuple(MOMO_SCHEMA.names[1:])
+BANK_COLUMNS = tuple(BANK_SCHEMA.names[1:])
 
 
 # ── Helper Functions ──────────────────────────────────────────
@@ -80,129 +161,219 @@ def generate_customer_profiles(n):
     55% low-income, 35% middle, 10% high.
     Each customer's anomaly threshold is personal, not universal.
     """
-    customers = []
-    for i in range(n):
-        tier      = random.choices(list(INCOME_TIERS.keys()), INCOME_TIER_WEIGHTS)[0]
-        tier_data = INCOME_TIERS[tier]
-        typical_amount = round(random.uniform(tier_data["min"], tier_data["max"]), 2)
-
-        customers.append({
-            "customer_id":           f"CUST-GH-{i:05d}",
-            "momo_account":          f"MOMO-GH-{i:05d}",
-            "bank_account":          f"BANK-GH-{i:05d}" if random.random() > 0.2 else None,
-            "region":                random.choice(REGIONS),
-            "income_tier":           tier,
-            "typical_amount_ghs":    typical_amount,
-            # Personal anomaly threshold — 3x typical transaction
-            # This is what MoneyGuard uses, not the BoG GHS 10,000 floor
-            "personal_alert_threshold": round(typical_amount * 3, 2),
-            "typical_channel":       random.choice(MOMO_CHANNELS),
-            "typical_tx_hour":       random.randint(8, 20),
-            "monthly_tx_count":      random.randint(5, 60),
-            "pin":                   f"{random.randint(1000, 9999)}",
-        })
-    return customers
-
-
-def random_timestamp(start_days_ago=90, end_days_ago=0):
-    """Generate a random timestamp within a window."""
-    start = datetime.now() - timedelta(days=start_days_ago)
-    end   = datetime.now() - timedelta(days=end_days_ago)
-    delta = end - start
-    return start + timedelta(seconds=random.randint(0, int(delta.total_seconds())))
-
-
-def amount_above_personal_threshold(customer, multiplier=3.5):
+    tier_ids   = RNG.choice(len(TIER_NAMES), n, p=INCOME_TIER_WEIGHTS)
+    # One uniform draw per tier with scalar bounds — no per-customer bound arrays
+    typical    = np.empty(n)
+    for t, tier_data in enumerate(INCOME_TIERS.values()):
+        in_tier = tier_ids == t
+        typical[in_tier] = RNG.uniform(tier_data["min"], tier_data["max"], in_tier.sum())
+    typical    = np.round(typical, 2)
+    # Personal anomaly threshold — 3x typical transaction
+    # This is what MoneyGuard uses, not the BoG GHS 10,000 floor
+    thresholds = np.round(typical * 3, 2)
+    has_bank   = RNG.random(n) > 0.2
+    region_idx = RNG.integers(0, len(REGIONS), n)
+    channels   = RNG.choice(MOMO_CHANNELS, n)
+    tx_hours   = RNG.integers(8, 21, n)
+    tx_counts  = RNG.integers(5, 61, n)
+    pins       = RNG.integers(1000, 10000, n)
+
+    serials    = np.char.zfill(np.arange(n).astype(str), 5)
+
+    # Parallel arrays, one per attribute, so generators can sample and index customers in bulk.
+    # bank_idx holds the positions of customers with a linked bank account;
+    # region_idx holds each customer's position in REGIONS.
+    return {
+        "customer_id":           np.char.add("CUST-GH-", serials),
+        "momo_account":          np.char.add("MOMO-GH-", serials),
+        "bank_account":          np.where(has_bank, np.char.add("BANK-GH-", serials), None),
+        "region":                REGIONS_ARR[region_idx],
+        "income_tier":           TIER_NAMES[tier_ids],
+        "typical_amount_ghs":    typical,
+        "personal_alert_threshold": thresholds,
+        "typical_channel":       channels,
+        "typical_tx_hour":       tx_hours,
+        "monthly_tx_count":      tx_counts,
+        "pin":                   pins.astype(str),
+        "bank_idx":              np.flatnonzero(has_bank),
+        "region_idx":            region_idx,
+    }
+
+
+def random_timestamps(n, start_days_ago=90, end_days_ago=0, hours=None):
     """
-    Generate a fraudulent amount that exceeds the customer's personal threshold.
+    Generate n random timestamps within a window in a single NumPy draw.
+    If hours=(lo, hi) is given, each timestamp is moved into that hour range.
+    """
+    start = np.datetime64(datetime.now() - timedelta(days=start_days_ago), "us")
+    span  = (start_days_ago - end_days_ago) * 86400
+    ts    = start + RNG.integers(0, span + 1, n).astype("timedelta64[s]")
+    return ts if hours is None else with_random_hour(ts, *hours)
+
+
+def with_random_hour(ts, lo, hi):
+    """Move each timestamp to a random hour in lo..hi on the same day, keeping minutes and seconds."""
+    within_hour = ts - ts.astype("datetime64[h]")
+    return (ts.astype("datetime64[D]")
+            + RNG.integers(lo, hi + 1, len(ts)).astype("timedelta64[h]")
+            + within_hour)
+
+
+def expand_hits(num_hits):
+    """
+    Flatten per-victim hit counts into one row per hit.
+    Returns each row's victim position and its hit number (0, 1, ...) within that victim's sequence.
+    """
+    victim_of = np.repeat(np.arange(len(num_hits)), num_hits)
+    first_row = np.repeat(np.cumsum(num_hits) - num_hits, num_hits)
+    return victim_of, np.arange(len(victim_of)) - first_row
+
+
+def amount_above_personal_threshold(typical, multiplier=3.5):
+    """
+    Generate fraudulent amounts that exceed each customer's personal threshold.
     For a low-income farmer (typical: GHS 400), this might be GHS 1,400.
     For a high-income professional (typical: GHS 8,000), this might be GHS 28,000.
     Both are equally suspicious relative to their baseline.
     """
-    return round(customer["typical_amount_ghs"] * multiplier, 2)
+    return np.round(typical * multiplier, 2)
 
 
-def amount_structured_below_personal_threshold(customer):
+def amount_structured_below_personal_threshold(threshold):
     """
     Generate structured draining amounts just below the customer's personal threshold.
     Attacker keeps each hit below the radar — but MoneyGuard detects the pattern.
     """
-    threshold = customer["personal_alert_threshold"]
-    return round(random.uniform(threshold * 0.7, threshold * 0.9), 2)
+    return np.round(RNG.uniform(threshold * 0.7, threshold * 0.9), 2)
+
+
+def normal_amounts(mean, sd):
+    """
+    Draw |N(mean, sd)| amounts rounded to the pesewa.
+    The abs and round passes run in place on the sampled buffer.
+    """
+    amount = RNG.normal(mean, sd)
+    np.abs(amount, out=amount)
+    return np.round(amount, 2, out=amount)
+
+
+def running_balances(start_balance, amount, hit):
+    """
+    Balances before and after a victim's hit-th debit of `amount`.
+    Computed into two output buffers only, rather than one temporary per operator.
+    """
+    before = np.multiply(amount, hit)
+    np.subtract(start_balance, before, out=before)
+    return before, np.subtract(before, amount)
+
+
+def agent_ids(region_idx):
+    """Sample an agent ID (AGT-<Region>-<nnnn>) from the pre-built pool for each region index."""
+    return AGENT_POOL[region_idx, RNG.integers(0, AGENT_POOL.shape[1], len(region_idx))]
+
+
+def attacker_accounts(n):
+    """Draw n attacker MoMo accounts (MOMO-ATK-nnnnn) from a single batch of random numbers."""
+    return np.char.add("MOMO-ATK-", RNG.integers(10000, 100000, n).astype(str))
+
+
+def device_ids(n):
+    """
+    Random 24-bit device IDs (DEV-xxxxxx), drawn in a single batch.
+    3n random bytes are hex-encoded once and split into 6-character chunks — no per-row formatting.
+    """
+    hex_ids = np.frombuffer(RNG.bytes(3 * n).hex().encode(), dtype="S6").astype(str)
+    return np.char.add("DEV-", hex_ids)
+
+
+def transaction_ids(prefix, start, n):
+    """Format n consecutive transaction IDs counting up from start, in one vectorised pass."""
+    return np.char.add(prefix, (start + np.arange(n)).astype(str))
+
+
+def concat_columns(parts, columns):
+    """Concatenate per-generator column dicts into a single dict of arrays, in schema order."""
+    return {col: np.concatenate([part[col] for part in parts]) for col in columns}
+
+
+def build_transactions(cols, ids, dtypes):
+    """Turn one batch of sorted columns into a typed DataFrame, rounding money columns to the pesewa."""
+    for col in MONEY_COLUMNS.intersection(cols):
+        cols[col] = np.round(cols[col], 2)
+    return pd.DataFrame({"transaction_id": ids, **cols}, copy=False).astype(dtypes)
 
 
 # ── Legitimate Transaction Generators ────────────────────────
 
 def generate_legit_momo(customers, n):
     """Generate n legitimate MoMo transactions."""
-    records = []
-    for _ in range(n):
-        customer     = random.choice(customers)
-        counterparty = random.choice(customers)
-        ts     = random_timestamp()
-        amount = round(
-            abs(np.random.normal(customer["typical_amount_ghs"],
-                                 customer["typical_amount_ghs"] * 0.3)), 2
-        )
-        records.append({
-            "transaction_id":         f"MOMO-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-            "timestamp":              ts,
-            "sender_account":         customer["momo_account"],
-            "receiver_account":       counterparty["momo_account"],
-            "amount_ghs":             amount,
-            "transaction_type":       random.choice(MOMO_TX_TYPES),
-            "channel":                customer["typical_channel"],
-            "agent_id":               f"AGT-{customer['region'].replace(' ', '')}-{random.randint(1,99):04d}"
-                                      if customer["typical_channel"] == "agent" else None,
-            "merchant_category":      random.choice(MERCHANT_CATEGORIES),
-            "location_region":        customer["region"],
-            "device_id":              f"DEV-{fake.md5()[:6]}",
-            "is_new_device":          False,
-            "otp_requested":          random.random() > 0.8,
-            "linked_bank_account":    customer["bank_account"],
-            "income_tier":            customer["income_tier"],
-            "personal_alert_threshold": customer["personal_alert_threshold"],
-            "label":                  0,
-            "attack_type":            "none",
-        })
-    return records
+    momo_accts = customers["momo_account"]
+    bank_accts = customers["bank_account"]
+    regions    = customers["region"]
+    tiers      = customers["income_tier"]
+    channels   = customers["typical_channel"]
+    typical    = customers["typical_amount_ghs"]
+    thresholds = customers["personal_alert_threshold"]
+
+    idx    = RNG.integers(0, len(momo_accts), n)
+    cp_idx = RNG.integers(0, len(momo_accts), n)
+    amount = normal_amounts(typical[idx], typical[idx] * 0.3)
+
+    channel    = channels[idx]
+    agent_id   = np.where(channel == "agent", agent_ids(customers["region_idx"][idx]), None)
+
+    return {
+        "timestamp":              random_timestamps(n),
+        "sender_account":         momo_accts[idx],
+        "receiver_account":       momo_accts[cp_idx],
+        "amount_ghs":             amount,
+        "transaction_type":       RNG.choice(MOMO_TX_TYPES, n),
+        "channel":                channel,
+        "agent_id":               agent_id,
+        "merchant_category":      RNG.choice(MERCHANT_CATEGORIES, n),
+        "location_region":        regions[idx],
+        "device_id":              device_ids(n),
+        "is_new_device":          np.zeros(n, dtype=bool),
+        "otp_requested":          RNG.random(n) > 0.8,
+        "linked_bank_account":    bank_accts[idx],
+        "income_tier":            tiers[idx],
+        "personal_alert_threshold": thresholds[idx],
+        "label":                  np.zeros(n, dtype=np.int8),
+        "attack_type":            np.full(n, "none"),
+    }
 
 
 def generate_legit_bank(customers, n):
     """Generate n legitimate bank transactions."""
-    records        = []
-    bank_customers = [c for c in customers if c["bank_account"]]
-    for _ in range(n):
-        customer     = random.choice(bank_customers)
-        counterparty = random.choice(bank_customers)
-        ts     = random_timestamp()
-        amount = round(
-            abs(np.random.normal(customer["typical_amount_ghs"] * 2,
-                                 customer["typical_amount_ghs"] * 0.5)), 2
-        )
-        balance_before = round(random.uniform(
-            customer["typical_amount_ghs"],
-            customer["typical_amount_ghs"] * 10
-        ), 2)
-        records.append({
-            "transaction_id":         f"BANK-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-            "timestamp":              ts,
-            "account_id":             customer["bank_account"],
-            "linked_momo_account":    customer["momo_account"],
-            "amount_ghs":             amount,
-            "transaction_type":       random.choice(BANK_TX_TYPES),
-            "channel":                random.choice(BANK_CHANNELS),
-            "counterparty_account":   counterparty["bank_account"],
-            "balance_before_ghs":     balance_before,
-            "balance_after_ghs":      round(balance_before - amount, 2),
-            "location_region":        customer["region"],
-            "is_after_hours":         False,
-            "income_tier":            customer["income_tier"],
-            "personal_alert_threshold": customer["personal_alert_threshold"],
-            "label":                  0,
-            "attack_type":            "none",
-        })
-    return records
+    momo_accts = customers["momo_account"]
+    bank_accts = customers["bank_account"]
+    regions    = customers["region"]
+    tiers      = customers["income_tier"]
+    typical    = customers["typical_amount_ghs"]
+    thresholds = customers["personal_alert_threshold"]
+
+    idx    = RNG.choice(customers["bank_idx"], n)
+    cp_idx = RNG.choice(customers["bank_idx"], n)
+    amount = normal_amounts(typical[idx] * 2, typical[idx] * 0.5)
+    balance_before = np.round(RNG.uniform(typical[idx], typical[idx] * 10), 2)
+
+    return {
+        "timestamp":              random_timestamps(n),
+        "account_id":             bank_accts[idx],
+        "linked_momo_account":    momo_accts[idx],
+        "amount_ghs":             amount,
+        "transaction_type":       RNG.choice(BANK_TX_TYPES, n),
+        "channel":                RNG.choice(BANK_CHANNELS, n),
+        "counterparty_account":   bank_accts[cp_idx],
+        "balance_before_ghs":     balance_before,
+        "balance_after_ghs":      balance_before - amount,
+        "location_region":        regions[idx],
+        "is_after_hours":         np.zeros(n, dtype=bool),
+        "income_tier":            tiers[idx],
+        "personal_alert_threshold": thresholds[idx],
+        "label":                  np.zeros(n, dtype=np.int8),
+        "attack_type":            np.full(n, "none"),
+    }
 
 
 # ── Attack Pattern Generators ─────────────────────────────────
@@ -215,35 +386,27 @@ def inject_otp_phishing(customers, n=30):
     A GHS 1,200 hit on a farmer is flagged just as a GHS 25,000 hit on an executive.
     Signals: new device, unusual hour, unknown merchant, OTP requested.
     """
-    records = []
-    for _ in range(n):
-        victim           = random.choice(customers)
-        attacker_account = f"MOMO-ATK-{random.randint(10000, 99999)}"
-        ts               = random_timestamp(start_days_ago=30)
-        ts               = ts.replace(hour=random.randint(22, 23))
-        amount           = amount_above_personal_threshold(victim)
-
-        records.append({
-            "transaction_id":         f"MOMO-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-            "timestamp":              ts,
-            "sender_account":         victim["momo_account"],
-            "receiver_account":       attacker_account,
-            "amount_ghs":             amount,
-            "transaction_type":       "send",
-            "channel":                "ussd",
-            "agent_id":               None,
-            "merchant_category":      "unknown",
-            "location_region":        victim["region"],
-            "device_id":              f"DEV-{fake.md5()[:6]}",
-            "is_new_device":          True,
-            "otp_requested":          True,
-            "linked_bank_account":    victim["bank_account"],
-            "income_tier":            victim["income_tier"],
-            "personal_alert_threshold": victim["personal_alert_threshold"],
-            "label":                  1,
-            "attack_type":            "otp_phishing",
-        })
-    return records
+    idx = RNG.integers(0, len(customers["momo_account"]), n)
+
+    return {
+        "timestamp":              random_timestamps(n, start_days_ago=30, hours=(22, 23)),
+        "sender_account":         customers["momo_account"][idx],
+        "receiver_account":       attacker_accounts(n),
+        "amount_ghs":             amount_above_personal_threshold(customers["typical_amount_ghs"][idx]),
+        "transaction_type":       np.full(n, "send"),
+        "channel":                np.full(n, "ussd"),
+        "agent_id":               np.full(n, None, dtype=object),
+        "merchant_category":      np.full(n, "unknown"),
+        "location_region":        customers["region"][idx],
+        "device_id":              device_ids(n),
+        "is_new_device":          np.ones(n, dtype=bool),
+        "otp_requested":          np.ones(n, dtype=bool),
+        "linked_bank_account":    customers["bank_account"][idx],
+        "income_tier":            customers["income_tier"][idx],
+        "personal_alert_threshold": customers["personal_alert_threshold"][idx],
+        "label":                  np.ones(n, dtype=np.int8),
+        "attack_type":            np.full(n, "otp_phishing"),
+    }
 
 
 def inject_account_takeover(customers, n=30):
@@ -253,57 +416,56 @@ def inject_account_takeover(customers, n=30):
     Amounts scaled to victim's income tier.
     Signals: new device, after-hours, channel switch, rapid successive transactions.
     """
-    momo_records   = []
-    bank_records   = []
-    bank_customers = [c for c in customers if c["bank_account"]]
-
-    for _ in range(n):
-        victim         = random.choice(bank_customers)
-        ts             = random_timestamp(start_days_ago=30)
-        ts             = ts.replace(hour=random.randint(1, 5))
-        amount         = amount_above_personal_threshold(victim)
-        balance_before = round(victim["typical_amount_ghs"] * random.uniform(4, 10), 2)
-
-        momo_records.append({
-            "transaction_id":         f"MOMO-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-            "timestamp":              ts,
-            "sender_account":         victim["momo_account"],
-            "receiver_account":       f"MOMO-ATK-{random.randint(10000, 99999)}",
-            "amount_ghs":             amount,
-            "transaction_type":       "transfer",
-            "channel":                "app",
-            "agent_id":               None,
-            "merchant_category":      "transfer",
-            "location_region":        random.choice(REGIONS),
-            "device_id":              f"DEV-{fake.md5()[:6]}",
-            "is_new_device":          True,
-            "otp_requested":          False,
-            "linked_bank_account":    victim["bank_account"],
-            "income_tier":            victim["income_tier"],
-            "personal_alert_threshold": victim["personal_alert_threshold"],
-            "label":                  1,
-            "attack_type":            "account_takeover",
-        })
-
-        bank_ts = ts + timedelta(hours=random.randint(24, 72))
-        bank_records.append({
-            "transaction_id":         f"BANK-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-            "timestamp":              bank_ts,
-            "account_id":             victim["bank_account"],
-            "linked_momo_account":    victim["momo_account"],
-            "amount_ghs":             amount,
-            "transaction_type":       "transfer",
-            "channel":                "momo",
-            "counterparty_account":   victim["momo_account"],
-            "balance_before_ghs":     balance_before,
-            "balance_after_ghs":      round(balance_before - amount, 2),
-            "location_region":        random.choice(REGIONS),
-            "is_after_hours":         True,
-            "income_tier":            victim["income_tier"],
-            "personal_alert_threshold": victim["personal_alert_threshold"],
-            "label":                  1,
-            "attack_type":            "account_takeover",
-        })
+    idx            = RNG.choice(customers["bank_idx"], n)
+
+    momo_accts     = customers["momo_account"][idx]
+    bank_accts     = customers["bank_account"][idx]
+    typical        = customers["typical_amount_ghs"][idx]
+    tiers          = customers["income_tier"][idx]
+    thresholds     = customers["personal_alert_threshold"][idx]
+
+    ts             = random_timestamps(n, start_days_ago=30, hours=(1, 5))
+    amount         = amount_above_personal_threshold(typical)
+    balance_before = np.round(typical * RNG.uniform(4, 10, n), 2)
+    bank_ts        = ts + RNG.integers(24, 73, n).astype("timedelta64[h]")
+
+    momo_records = {
+        "timestamp":              ts,
+        "sender_account":         momo_accts,
+        "receiver_account":       attacker_accounts(n),
+        "amount_ghs":             amount,
+        "transaction_type":       np.full(n, "transfer"),
+        "channel":                np.full(n, "app"),
+        "agent_id":               np.full(n, None, dtype=object),
+        "merchant_category":      np.full(n, "transfer"),
+        "location_region":        RNG.choice(REGIONS_ARR, n),
+        "device_id":              device_ids(n),
+        "is_new_device":          np.ones(n, dtype=bool),
+        "otp_requested":          np.zeros(n, dtype=bool),
+        "linked_bank_account":    bank_accts,
+        "income_tier":            tiers,
+        "personal_alert_threshold": thresholds,
+        "label":                  np.ones(n, dtype=np.int8),
+        "attack_type":            np.full(n, "account_takeover"),
+    }
+
+    bank_records = {
+        "timestamp":              bank_ts,
+        "account_id":             bank_accts,
+        "linked_momo_account":    momo_accts,
+        "amount_ghs":             amount,
+        "transaction_type":       np.full(n, "transfer"),
+        "channel":                np.full(n, "momo"),
+        "counterparty_account":   momo_accts,
+        "balance_before_ghs":     balance_before,
+        "balance_after_ghs":      balance_before - amount,
+        "location_region":        RNG.choice(REGIONS_ARR, n),
+        "is_after_hours":         np.ones(n, dtype=bool),
+        "income_tier":            tiers,
+        "personal_alert_threshold": thresholds,
+        "label":                  np.ones(n, dtype=np.int8),
+        "attack_type":            np.full(n, "account_takeover"),
+    }
 
     return momo_records, bank_records
 
@@ -317,60 +479,64 @@ def inject_structured_draining(customers, n=30):
     Both patterns are detected by MoneyGuard through velocity + behavioural analysis.
     Signals: repeated amounts just below personal threshold, same receiver, high velocity.
     """
-    momo_records   = []
-    bank_records   = []
-    bank_customers = [c for c in customers if c["bank_account"]]
-
-    for _ in range(n):
-        victim         = random.choice(bank_customers)
-        attacker_momo  = f"MOMO-ATK-{random.randint(10000, 99999)}"
-        base_ts        = random_timestamp(start_days_ago=30)
-        balance_before = round(victim["typical_amount_ghs"] * random.uniform(5, 12), 2)
-        num_hits       = random.randint(3, 8)
-
-        for hit in range(num_hits):
-            hit_ts = base_ts + timedelta(minutes=random.randint(5, 30) * hit)
-            amount = amount_structured_below_personal_threshold(victim)
-
-            bank_records.append({
-                "transaction_id":         f"BANK-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-                "timestamp":              hit_ts,
-                "account_id":             victim["bank_account"],
-                "linked_momo_account":    victim["momo_account"],
-                "amount_ghs":             amount,
-                "transaction_type":       "transfer",
-                "channel":                "momo",
-                "counterparty_account":   victim["momo_account"],
-                "balance_before_ghs":     round(balance_before - (amount * hit), 2),
-                "balance_after_ghs":      round(balance_before - (amount * (hit + 1)), 2),
-                "location_region":        victim["region"],
-                "is_after_hours":         hit_ts.hour > 22 or hit_ts.hour < 6,
-                "income_tier":            victim["income_tier"],
-                "personal_alert_threshold": victim["personal_alert_threshold"],
-                "label":                  1,
-                "attack_type":            "structured_drain",
-            })
-
-            momo_records.append({
-                "transaction_id":         f"MOMO-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-                "timestamp":              hit_ts + timedelta(minutes=random.randint(1, 10)),
-                "sender_account":         victim["momo_account"],
-                "receiver_account":       attacker_momo,
-                "amount_ghs":             amount,
-                "transaction_type":       "withdraw",
-                "channel":                "agent",
-                "agent_id":               f"AGT-{random.choice(REGIONS).replace(' ','')}-{random.randint(1,99):04d}",
-                "merchant_category":      "unknown",
-                "location_region":        random.choice(REGIONS),
-                "device_id":              f"DEV-{fake.md5()[:6]}",
-                "is_new_device":          True,
-                "otp_requested":          False,
-                "linked_bank_account":    victim["bank_account"],
-                "income_tier":            victim["income_tier"],
-                "personal_alert_threshold": victim["personal_alert_threshold"],
-                "label":                  1,
-                "attack_type":            "structured_drain",
-            })
+    idx            = RNG.choice(customers["bank_idx"], n)
+    num_hits       = RNG.integers(3, 9, n)
+    attacker       = attacker_accounts(n)
+    base_ts        = random_timestamps(n, start_days_ago=30)
+    start_balance  = np.round(customers["typical_amount_ghs"][idx] * RNG.uniform(5, 12, n), 2)
+
+    # One row per hit — the i-th hit lands i x (5–30) minutes after the first
+    victim_of, hit = expand_hits(num_hits)
+    total          = len(victim_of)
+    row_idx        = idx[victim_of]
+    thresholds     = customers["personal_alert_threshold"][row_idx]
+    hit_ts         = base_ts[victim_of] + (RNG.integers(5, 31, total) * hit).astype("timedelta64[m]")
+    amount         = amount_structured_below_personal_threshold(thresholds)
+    balance_before, balance_after = running_balances(start_balance[victim_of], amount, hit)
+    attacker_momo  = attacker[victim_of]
+
+    momo_accts = customers["momo_account"][row_idx]
+    bank_accts = customers["bank_account"][row_idx]
+    tiers      = customers["income_tier"][row_idx]
+    hours      = hit_ts.astype("datetime64[h]").astype(np.int64) % 24
+
+    bank_records = {
+        "timestamp":              hit_ts,
+        "account_id":             bank_accts,
+        "linked_momo_account":    momo_accts,
+        "amount_ghs":             amount,
+        "transaction_type":       np.full(total, "transfer"),
+        "channel":                np.full(total, "momo"),
+        "counterparty_account":   momo_accts,
+        "balance_before_ghs":     balance_before,
+        "balance_after_ghs":      balance_after,
+        "location_region":        customers["region"][row_idx],
+        "is_after_hours":         (hours > 22) | (hours < 6),
+        "income_tier":            tiers,
+        "personal_alert_threshold": thresholds,
+        "label":                  np.ones(total, dtype=np.int8),
+        "attack_type":            np.full(total, "structured_drain"),
+    }
+
+    momo_records = {
+        "timestamp":              hit_ts + RNG.integers(1, 11, total).astype("timedelta64[m]"),
+        "sender_account":         momo_accts,
+        "receiver_account":       attacker_momo,
+        "amount_ghs":             amount,
+        "transaction_type":       np.full(total, "withdraw"),
+        "channel":                np.full(total, "agent"),
+        "agent_id":               agent_ids(RNG.integers(0, len(REGIONS), total)),
+        "merchant_category":      np.full(total, "unknown"),
+        "location_region":        RNG.choice(REGIONS_ARR, total),
+        "device_id":              device_ids(total),
+        "is_new_device":          np.ones(total, dtype=bool),
+        "otp_requested":          np.zeros(total, dtype=bool),
+        "linked_bank_account":    bank_accts,
+        "income_tier":            tiers,
+        "personal_alert_threshold": thresholds,
+        "label":                  np.ones(total, dtype=np.int8),
+        "attack_type":            np.full(total, "structured_drain"),
+    }
 
     return momo_records, bank_records
 
@@ -383,93 +549,149 @@ def inject_lateral_movement(customers, n=30):
     Amounts scaled to victim's income tier — protects low-income users equally.
     Signals: MoMo event followed by bank drain 24-72 hours later, same linked accounts.
     """
-    momo_records   = []
-    bank_records   = []
-    bank_customers = [c for c in customers if c["bank_account"]]
-
-    for _ in range(n):
-        victim         = random.choice(bank_customers)
-        attacker_momo  = f"MOMO-ATK-{random.randint(10000, 99999)}"
-        stage1_ts      = random_timestamp(start_days_ago=30)
-        stage1_ts      = stage1_ts.replace(hour=random.randint(18, 22))
-        # Stage 1 is a small hit — below suspicion on its own
-        amount_stage1  = round(victim["typical_amount_ghs"] * 0.8, 2)
-        balance_before = round(victim["typical_amount_ghs"] * random.uniform(4, 10), 2)
-
-        # Stage 1 — MoMo compromise
-        momo_records.append({
-            "transaction_id":         f"MOMO-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-            "timestamp":              stage1_ts,
-            "sender_account":         victim["momo_account"],
-            "receiver_account":       attacker_momo,
-            "amount_ghs":             amount_stage1,
-            "transaction_type":       "send",
-            "channel":                "ussd",
-            "agent_id":               None,
-            "merchant_category":      "unknown",
-            "location_region":        victim["region"],
-            "device_id":              f"DEV-{fake.md5()[:6]}",
-            "is_new_device":          True,
-            "otp_requested":          True,
-            "linked_bank_account":    victim["bank_account"],
-            "income_tier":            victim["income_tier"],
-            "personal_alert_threshold": victim["personal_alert_threshold"],
-            "label":                  1,
-            "attack_type":            "lateral_movement",
-        })
-
-        # Stage 2 — Bank drain 24–72 hours later
-        num_bank_hits = random.randint(2, 5)
-        for hit in range(num_bank_hits):
-            stage2_ts     = stage1_ts + timedelta(hours=random.randint(24, 72))
-            stage2_ts     = stage2_ts.replace(hour=random.randint(1, 4))
-            amount_stage2 = amount_above_personal_threshold(victim, multiplier=2.5)
-
-            bank_records.append({
-                "transaction_id":         f"BANK-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-                "timestamp":              stage2_ts,
-                "account_id":             victim["bank_account"],
-                "linked_momo_account":    victim["momo_account"],
-                "amount_ghs":             amount_stage2,
-                "transaction_type":       "transfer",
-                "channel":                "momo",
-                "counterparty_account":   victim["momo_account"],
-                "balance_before_ghs":     round(balance_before - (amount_stage2 * hit), 2),
-                "balance_after_ghs":      round(balance_before - (amount_stage2 * (hit + 1)), 2),
-                "location_region":        random.choice(REGIONS),
-                "is_after_hours":         True,
-                "income_tier":            victim["income_tier"],
-                "personal_alert_threshold": victim["personal_alert_threshold"],
-                "label":                  1,
-                "attack_type":            "lateral_movement",
-            })
-
-            momo_records.append({
-                "transaction_id":         f"MOMO-TXN-{fake.unique.random_int(min=100000, max=999999)}",
-                "timestamp":              stage2_ts + timedelta(minutes=random.randint(2, 15)),
-                "sender_account":         victim["momo_account"],
-                "receiver_account":       attacker_momo,
-                "amount_ghs":             amount_stage2,
-                "transaction_type":       "withdraw",
-                "channel":               "agent",
-                "agent_id":               f"AGT-{random.choice(REGIONS).replace(' ','')}-{random.randint(1,99):04d}",
-                "merchant_category":      "unknown",
-                "location_region":        random.choice(REGIONS),
-                "device_id":              f"DEV-{fake.md5()[:6]}",
-                "is_new_device":          True,
-                "otp_requested":          False,
-                "linked_bank_account":    victim["bank_account"],
-                "income_tier":            victim["income_tier"],
-                "personal_alert_threshold": victim["personal_alert_threshold"],
-                "label":                  1,
-                "attack_type":            "lateral_movement",
-            })
-
-    return momo_records, bank_records
+    idx            = RNG.choice(customers["bank_idx"], n)
+    momo_accts     = customers["momo_account"][idx]
+    bank_accts     = customers["bank_account"][idx]
+    typical        = customers["typical_amount_ghs"][idx]
+    tiers          = customers["income_tier"][idx]
+    thresholds     = customers["personal_alert_threshold"][idx]
+    attacker_momo  = attacker_accounts(n)
+    stage1_ts      = random_timestamps(n, start_days_ago=30, hours=(18, 22))
+    # Stage 1 is a small hit — below suspicion on its own
+    amount_stage1  = np.round(typical * 0.8, 2)
+    start_balance  = np.round(typical * RNG.uniform(4, 10, n), 2)
+
+    # Stage 2 — one row per bank hit, each 24–72 hours after stage 1, in the small hours
+    victim_of, hit = expand_hits(RNG.integers(2, 6, n))
+    total          = len(victim_of)
+    stage2_ts      = with_random_hour(
+        stage1_ts[victim_of] + RNG.integers(24, 73, total).astype("timedelta64[h]"), 1, 4
+    )
+    amount_stage2  = amount_above_personal_threshold(typical, multiplier=2.5)
+    balance_before, balance_after = running_balances(start_balance[victim_of], amount_stage2[victim_of], hit)
+
+    stage1_momo = {
+        "timestamp":              stage1_ts,
+        "sender_account":         momo_accts,
+        "receiver_account":       attacker_momo,
+        "amount_ghs":             amount_stage1,
+        "transaction_type":       np.full(n, "send"),
+        "channel":                np.full(n, "ussd"),
+        "agent_id":               np.full(n, None, dtype=object),
+        "merchant_category":      np.full(n, "unknown"),
+        "location_region":        customers["region"][idx],
+        "device_id":              device_ids(n),
+        "is_new_device":          np.ones(n, dtype=bool),
+        "otp_requested":          np.ones(n, dtype=bool),
+        "linked_bank_account":    bank_accts,
+        "income_tier":            tiers,
+        "personal_alert_threshold": thresholds,
+        "label":                  np.ones(n, dtype=np.int8),
+        "attack_type":            np.full(n, "lateral_movement"),
+    }
+
+    # Stage 2 — Bank drain 24–72 hours later
+    bank_records = {
+        "timestamp":              stage2_ts,
+        "account_id":             bank_accts[victim_of],
+        "linked_momo_account":    momo_accts[victim_of],
+        "amount_ghs":             amount_stage2[victim_of],
+        "transaction_type":       np.full(total, "transfer"),
+        "channel":                np.full(total, "momo"),
+        "counterparty_account":   momo_accts[victim_of],
+        "balance_before_ghs":     balance_before,
+        "balance_after_ghs":      balance_after,
+        "location_region":        RNG.choice(REGIONS_ARR, total),
+        "is_after_hours":         np.ones(total, dtype=bool),
+        "income_tier":            tiers[victim_of],
+        "personal_alert_threshold": thresholds[victim_of],
+        "label":                  np.ones(total, dtype=np.int8),
+        "attack_type":            np.full(total, "lateral_movement"),
+    }
+
+    stage2_momo = {
+        "timestamp":              stage2_ts + RNG.integers(2, 16, total).astype("timedelta64[m]"),
+        "sender_account":         momo_accts[victim_of],
+        "receiver_account":       attacker_momo[victim_of],
+        "amount_ghs":             amount_stage2[victim_of],
+        "transaction_type":       np.full(total, "withdraw"),
+        "channel":                np.full(total, "agent"),
+        "agent_id":               agent_ids(RNG.integers(0, len(REGIONS), total)),
+        "merchant_category":      np.full(total, "unknown"),
+        "location_region":        RNG.choice(REGIONS_ARR, total),
+        "device_id":              device_ids(total),
+        "is_new_device":          np.ones(total, dtype=bool),
+        "otp_requested":          np.zeros(total, dtype=bool),
+        "linked_bank_account":    bank_accts[victim_of],
+        "income_tier":            tiers[victim_of],
+        "personal_alert_threshold": thresholds[victim_of],
+        "label":                  np.ones(total, dtype=np.int8),
+        "attack_type":            np.full(total, "lateral_movement"),
+    }
+
+    return concat_columns([stage1_momo, stage2_momo], MOMO_COLUMNS), bank_records
 
 
 # ── Main Pipeline ─────────────────────────────────────────────
 
+def write_transactions(parts, path, id_prefix, columns, dtypes, schema):
+    """
+    Write generator outputs to one CSV in global timestamp order via PyArrow's CSVWriter.
+    The parts are consumed: each column is popped from every part as it is concatenated,
+    so the raw data is held once, not twice. Only the sort order is computed up front;
+    rows are then gathered, numbered and typed WRITE_BATCH_ROWS at a time.
+    A global sort needs every row in memory, so peak memory is the data itself plus
+    the sort order and one batch — not a fixed chunk size.
+    Returns (legitimate, fraudulent) row counts.
+    """
+    cols     = {col: np.concatenate([part.pop(col) for part in parts]) for col in columns}
+    order    = np.argsort(cols["timestamp"], kind="stable")
+    total    = len(order)
+    first_id = RNG.integers(10**8, 10**9 - total)
+
+    with pacsv.CSVWriter(path, schema) as writer:
+        for start in range(0, total, WRITE_BATCH_ROWS):
+            rows = order[start:start + WRITE_BATCH_ROWS]
+            ids  = transaction_ids(id_prefix, first_id + start, len(rows))
+            df   = build_transactions({col: values[rows] for col, values in cols.items()}, ids, dtypes)
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+
+    fraud = int(cols["label"].sum())
+    return total - fraud, fraud
+
+
+def run_seeded(rng, generator, *args):
+    """Run one generator with this task's own spawned RNG installed, restoring the previous one after."""
+    global RNG
+    previous, RNG = RNG, rng
+    try:
+        return generator(*args)
+    finally:
+        RNG = previous
+
+
+def run_tasks(tasks, customers):
+    """
+    Run (generator, size, expected_rows) tasks, each with its own spawned child of RNG,
+    yielding results in task order. Runs expected to write PARALLEL_MIN_ROWS or more rows
+    fan out over a process pool; smaller ones run in-process, where pool start-up would dominate.
+    Output is identical either way.
+    """
+    rngs = RNG.spawn(len(tasks))
+    if sum(rows for _, _, rows in tasks) < PARALLEL_MIN_ROWS:
+        for rng, (generator, size, _) in zip(rngs, tasks):
+            yield run_seeded(rng, generator, customers, size)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as pool:
+        futures = [
+            pool.submit(run_seeded, rng, generator, customers, size)
+            for rng, (generator, size, _) in zip(rngs, tasks)
+        ]
+        for future in futures:
+            yield future.result()
+
+
 def main():
     print("=" * 55)
     print("  MoneyGuard — Synthetic Data Generator")
@@ -479,43 +701,58 @@ def main():
     customers = generate_customer_profiles(NUM_CUSTOMERS)
 
     # Show income tier distribution
-    tiers = [c["income_tier"] for c in customers]
-    print(f"       Income tiers — Low: {tiers.count('low')} | "
-          f"Middle: {tiers.count('middle')} | High: {tiers.count('high')}")
-
-    print(f"[2/6] Generating {NUM_MOMO_LEGIT} legitimate MoMo transactions...")
-    momo_legit = generate_legit_momo(customers, NUM_MOMO_LEGIT)
+    tiers = customers["income_tier"]
+    print(f"       Income tiers — Low: {(tiers == 'low').sum()} | "
+          f"Middle: {(tiers == 'middle').sum()} | High: {(tiers == 'high').sum()}")
 
-    print(f"[3/6] Generating {NUM_BANK_LEGIT} legitimate bank transactions...")
-    bank_legit = generate_legit_bank(customers, NUM_BANK_LEGIT)
-
-    print(f"[4/6] Injecting attack patterns ({NUM_ATTACKS} sequences)...")
+    # Generators are independent and only read the customer arrays, so large runs go in parallel.
     n = NUM_ATTACKS // 4
-
-    momo_otp                   = inject_otp_phishing(customers, n)
-    momo_ato, bank_ato         = inject_account_takeover(customers, n)
-    momo_drain, bank_drain     = inject_structured_draining(customers, n)
-    momo_lateral, bank_lateral = inject_lateral_movement(customers, n)
-
-    print("[5/6] Combining and saving datasets...")
-    all_momo = momo_legit + momo_otp + momo_ato + momo_drain + momo_lateral
-    all_bank = bank_legit + bank_ato + bank_drain + bank_lateral
-
-    momo_df = pd.DataFrame(all_momo).sort_values("timestamp").reset_index(drop=True)
-    bank_df = pd.DataFrame(all_bank).sort_values("timestamp").reset_index(drop=True)
-
+    # (generator, size, expected rows) — attack sizes count victims, not rows
+    tasks = [
+        (generate_legit_momo,        NUM_MOMO_LEGIT, NUM_MOMO_LEGIT),
+        (generate_legit_bank,        NUM_BANK_LEGIT, NUM_BANK_LEGIT),
+        (inject_otp_phishing,        n, n),
+        (inject_account_takeover,    n, 2 * n),     # one MoMo + one bank row per victim
+        (inject_structured_draining, n, 11 * n),    # 3–8 hits, one bank + one MoMo row each
+        (inject_lateral_movement,    n, 8 * n),     # stage-1 row + 2–5 hits, one bank + one MoMo row each
+    ]
+    progress = {
+        0:              f"[2/6] Generated {NUM_MOMO_LEGIT} legitimate MoMo transactions",
+        1:              f"[3/6] Generated {NUM_BANK_LEGIT} legitimate bank transactions",
+        len(tasks) - 1: f"[4/6] Injected attack patterns ({NUM_ATTACKS} sequences)",
+    }
+
+    results = []
+    for i, result in enumerate(run_tasks(tasks, customers)):
+        results.append(result)
+        if i in progress:
+            print(progress[i])
+
+    momo_legit, bank_legit, momo_otp = results[:3]
+    (momo_ato, bank_ato), (momo_drain, bank_drain), (momo_lateral, bank_lateral) = results[3:]
+
+    print("[5/6] Writing datasets to CSV...")
+    # write_transactions consumes the parts — their columns are freed as they are merged
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    momo_df.to_csv(os.path.join(OUTPUT_DIR, "momo_transactions.csv"), index=False)
-    bank_df.to_csv(os.path.join(OUTPUT_DIR, "bank_transactions.csv"), index=False)
+    momo_legit_n, momo_fraud_n = write_transactions(
+        [momo_legit, momo_otp, momo_ato, momo_drain, momo_lateral],
+        os.path.join(OUTPUT_DIR, "momo_transactions.csv"), "MOMO-TXN-",
+        MOMO_COLUMNS, MOMO_DTYPES, MOMO_SCHEMA,
+    )
+    bank_legit_n, bank_fraud_n = write_transactions(
+        [bank_legit, bank_ato, bank_drain, bank_lateral],
+        os.path.join(OUTPUT_DIR, "bank_transactions.csv"), "BANK-TXN-",
+        BANK_COLUMNS, BANK_DTYPES, BANK_SCHEMA,
+    )
 
     print("[6/6] Done!\n")
     print("=" * 55)
-    print(f"  MoMo transactions : {len(momo_df):,}")
-    print(f"    └─ Legitimate   : {(momo_df['label'] == 0).sum():,}")
-    print(f"    └─ Fraudulent   : {(momo_df['label'] == 1).sum():,}")
-    print(f"\n  Bank transactions : {len(bank_df):,}")
-    print(f"    └─ Legitimate   : {(bank_df['label'] == 0).sum():,}")
-    print(f"    └─ Fraudulent   : {(bank_df['label'] == 1).sum():,}")
+    print(f"  MoMo transactions : {momo_legit_n + momo_fraud_n:,}")
+    print(f"    └─ Legitimate   : {momo_legit_n:,}")
+    print(f"    └─ Fraudulent   : {momo_fraud_n:,}")
+    print(f"\n  Bank transactions : {bank_legit_n + bank_fraud_n:,}")
+    print(f"    └─ Legitimate   : {bank_legit_n:,}")
+    print(f"    └─ Fraudulent   : {bank_fraud_n:,}")
     print(f"\n  Saved to  : {OUTPUT_DIR}/")
     print(f"  BoG floor : GHS {BOG_REPORTING_THRESHOLD:,} (regulatory floor only)")
     print(f"  Detection : Behavioural baselining per customer income tier")
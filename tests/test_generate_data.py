@@ -0,0 +1,100 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "src" / "data" / "generate_data.py"
+
+
+@pytest.fixture(scope="module")
+def gd():
+    spec = importlib.util.spec_from_file_location("generate_data", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module    # lets the process pool pickle the generators by name
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def bank_csv(gd, tmp_path_factory):
+    customers = gd.generate_customer_profiles(300)
+    parts = [gd.generate_legit_bank(customers, 4000)]
+    for inject in (gd.inject_account_takeover, gd.inject_structured_draining, gd.inject_lateral_movement):
+        parts.append(inject(customers, 50)[1])
+
+    path = tmp_path_factory.mktemp("synthetic") / "bank_transactions.csv"
+    gd.write_transactions(parts, path, "BANK-TXN-", gd.BANK_COLUMNS, gd.BANK_DTYPES, gd.BANK_SCHEMA)
+    return pd.read_csv(path, parse_dates=["timestamp"])
+
+
+def test_bank_balances_reconcile(bank_csv):
+    """balance_before_ghs - amount_ghs == balance_after_ghs, to the pesewa, on every row."""
+    diff = bank_csv["balance_before_ghs"] - bank_csv["amount_ghs"] - bank_csv["balance_after_ghs"]
+    assert np.abs(diff).max() < 0.005
+
+
+def test_rows_time_ordered_and_ids_follow_time(bank_csv):
+    """Rows are sorted across the whole file and IDs follow time order, not the label."""
+    ids = bank_csv["transaction_id"].str.rsplit("-", n=1).str[1].astype(np.int64)
+    assert bank_csv["timestamp"].is_monotonic_increasing
+    assert ids.is_monotonic_increasing and ids.is_unique
+    assert ids[bank_csv["label"] == 0].max() > ids[bank_csv["label"] == 1].min()
+
+
+
+def test_expand_hits(gd):
+    victim_of, hit = gd.expand_hits(np.array([3, 1, 2]))
+    assert victim_of.tolist() == [0, 0, 0, 1, 2, 2]
+    assert hit.tolist() == [0, 1, 2, 0, 0, 1]
+
+
+def test_with_random_hour_keeps_minutes_and_seconds(gd):
+    ts = gd.random_timestamps(1000)
+    moved = gd.with_random_hour(ts, 22, 23)
+    hours = moved.astype("datetime64[h]").astype(np.int64) % 24
+    assert set(hours.tolist()) <= {22, 23}
+    assert (moved.astype("datetime64[D]") == ts.astype("datetime64[D]")).all()
+    assert (moved - moved.astype("datetime64[h]") == ts - ts.astype("datetime64[h]")).all()
+
+
+def test_device_ids(gd):
+    ids = gd.device_ids(500)
+    assert len(ids) == 500
+    assert pd.Series(ids).str.fullmatch(r"DEV-[0-9a-f]{6}").all()
+
+
+def test_lateral_movement_bank_hits_in_small_hours(gd):
+    customers = gd.generate_customer_profiles(300)
+    _, bank_records = gd.inject_lateral_movement(customers, 50)
+    hours = bank_records["timestamp"].astype("datetime64[h]").astype(np.int64) % 24
+    assert set(hours.tolist()) <= {1, 2, 3, 4}
+
+def test_process_pool_matches_in_process(gd, monkeypatch):
+    """The pool branch, forced on with PARALLEL_MIN_ROWS = 0, reproduces the in-process run."""
+    customers = gd.generate_customer_profiles(300)
+    tasks = [
+        (gd.generate_legit_momo,        500, 500),
+        (gd.generate_legit_bank,        300, 300),
+        (gd.inject_otp_phishing,        10, 10),
+        (gd.inject_account_takeover,    10, 20),
+        (gd.inject_structured_draining, 10, 110),
+        (gd.inject_lateral_movement,    10, 80),
+    ]
+
+    def run(min_rows):
+        monkeypatch.setattr(gd, "PARALLEL_MIN_ROWS", min_rows)
+        monkeypatch.setattr(gd, "RNG", np.random.default_rng(gd.SEED))
+        parts = []
+        for result in gd.run_tasks(tasks, customers):
+            parts.extend(result if isinstance(result, tuple) else [result])
+        return parts
+
+    serial, pooled = run(10**9), run(0)
+    assert len(serial) == len(pooled) == 9
+    for a, b in zip(serial, pooled):
+        assert a.keys() == b.keys()
+        for col in a.keys() - {"timestamp"}:
+            np.testing.assert_array_equal(a[col], b[col], err_msg=col)